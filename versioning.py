@@ -1,10 +1,44 @@
+import contextlib
+import functools
 import hashlib
 import json
+import locale
+import mmap
+import os
+import struct
 from pathlib import Path
 import re
 import argparse
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows, see file_lock()
+    fcntl = None
+    import msvcrt
+
+try:
+    import blake3
+except ImportError:  # optional, falls back to hashlib
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to json
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, falls back to zlib
+    zstandard = None
+
+try:
+    import xxhash
+except ImportError:  # optional, only needed for the xxh3_128 object hash
+    xxhash = None
+
 # ----------------------------
 # Paths
 # ----------------------------
@@ -12,57 +46,451 @@ BASE_DIR = Path("dataset_repo")
 OBJECTS_DIR = BASE_DIR / "objects"
 COMMITS_DIR = BASE_DIR / "commits"
 HEAD_FILE = BASE_DIR / "HEAD"
+PACK_FILE = COMMITS_DIR / "pack.bin"
+PACK_INDEX_FILE = COMMITS_DIR / "pack.idx"
+PACK_LOCK_FILE = COMMITS_DIR / "pack.lock"
+RAW_HASH_CACHE_FILE = BASE_DIR / ".raw_hash_cache.json"
 
 OBJECTS_DIR.mkdir(parents=True, exist_ok=True)
 COMMITS_DIR.mkdir(parents=True, exist_ok=True)
 
+HASHERS = {"sha256": hashlib.sha256}
+if blake3 is not None:
+    HASHERS["blake3"] = blake3.blake3
+if xxhash is not None:
+    HASHERS["xxh3_128"] = xxhash.xxh3_128
+
+# Commit IDs and cache keys always use a 256-bit hash (pack.idx stores
+# 32-byte IDs). Objects are looked up by whatever hex digest addressed
+# them, so DATASET_HASH_ALGO can opt object and raw-file hashing into the
+# non-cryptographic xxh3_128 without affecting existing objects.
+HASH_ALGO = "blake3" if blake3 is not None else "sha256"
+OBJECT_HASH_ALGO = os.environ.get("DATASET_HASH_ALGO", HASH_ALGO)
+
+# Objects are stored compressed and recognised by magic number on load;
+# anything without one is an uncompressed object from an older repo.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 1
+
+# pack.idx record: raw 32-byte commit ID, offset and length in pack.bin
+PACK_RECORD = struct.Struct("<32sQI")
+
+# Object writes are buffered this much to keep write() calls per block low
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Raw files are read this many bytes (rounded to whole lines) at a time
+BLOCK_SIZE = 1 << 16
+
+# Part of every raw hash cache version key: bump it whenever the output of
+# preprocessing changes, so objects cached by older code are not reused
+PREPROCESS_VERSION = 1
+
 
 # ----------------------------
 # Hash Utilities
 # ----------------------------
-def hash_content(content: str) -> str:
-    return hashlib.sha256(content.encode()).hexdigest()
+def check_object_hash_algo():
+    # Checked only where objects are hashed, so log and checkout keep
+    # working with a stale or unavailable DATASET_HASH_ALGO
+    if OBJECT_HASH_ALGO not in HASHERS:
+        raise ValueError(
+            f"DATASET_HASH_ALGO={OBJECT_HASH_ALGO!r} is not available; "
+            f"choose one of {sorted(HASHERS)}"
+        )
+
+
+def new_hasher(algo=HASH_ALGO):
+    return HASHERS[algo]()
+
+
+def hash_content(content, algo=HASH_ALGO) -> str:
+    if isinstance(content, str):
+        content = content.encode()
+
+    hasher = new_hasher(algo)
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+def hash_file(path, algo=HASH_ALGO) -> str:
+    hasher = new_hasher(algo)
+    with open(path, "rb") as f:
+        while chunk := f.read(BLOCK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+# ----------------------------
+# File Utilities
+# ----------------------------
+def fsync_file(path):
+    with open(path, "ab") as f:
+        os.fsync(f.fileno())
+
+
+def fsync_dir(path):
+    # Directories can only be opened for fsync on POSIX
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Hold an exclusive inter-process lock on path for the with-block."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def drop_page_cache(f):
+    # Objects are rarely read back soon after being written; once synced,
+    # let the kernel reclaim their pages instead of evicting hotter data
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def atomic_write(path, data: bytes, sync=True):
+    """Write via a temp file and rename, so readers never see a partial file."""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+
+    with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+# ----------------------------
+# JSON Utilities
+# ----------------------------
+# Hash inputs are always serialized with the stdlib json module so commit
+# IDs do not depend on whether orjson is installed.
+def loads_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def read_json(path):
+    return loads_json(Path(path).read_bytes())
+
+
+def write_json(path, obj, sync=True):
+    atomic_write(path, dumps_json(obj), sync)
 
 
 # ----------------------------
 # Content Addressable Storage
 # ----------------------------
-def store_object(content: str) -> str:
-    object_hash = hash_content(content)
+def get_object_path(object_hash: str) -> Path:
+    return OBJECTS_DIR / object_hash[:2] / object_hash[2:]
 
-    subdir = OBJECTS_DIR / object_hash[:2]
-    subdir.mkdir(parents=True, exist_ok=True)
 
-    object_path = subdir / object_hash[2:]
+def new_compressor():
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    return zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
 
-    # Deduplication happens here
-    if not object_path.exists():
-        object_path.write_text(content)
 
-    return object_hash
+def decompress_object(data: bytes) -> bytes:
+    if data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed object found; install zstandard to read it")
+        # decompressobj() also handles frames written without a content size
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+    if data.startswith(GZIP_MAGIC):
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+    return data
 
 
 def load_object(object_hash: str) -> str:
-    object_path = OBJECTS_DIR / object_hash[:2] / object_hash[2:]
-    return object_path.read_text()
+    data = get_object_path(object_hash).read_bytes()
+    return decompress_object(data).decode()
 
 
 # ----------------------------
 # Preprocessing
 # ----------------------------
-def preprocess_text(text, config):
-    if config.get("lowercase"):
-        text = text.lower()
+PUNCT_RE = re.compile(r"[^\w\s]")
+DEDUP_MODES = ("exact", "hash64")
+
+
+def build_ascii_table(lowercase, remove_punctuation):
+    table = {}
+    for code in range(128):
+        char = chr(code)
+        if remove_punctuation and not (char.isalnum() or char.isspace() or char == "_"):
+            table[code] = None
+        elif lowercase:
+            table[code] = char.lower()
+    return table
+
+
+# str.translate() with these tables does lowercase + punctuation removal in
+# a single C-level pass; keyed on (lowercase, remove_punctuation).
+ASCII_TABLES = {
+    (True, False): build_ascii_table(True, False),
+    (False, True): build_ascii_table(False, True),
+    (True, True): build_ascii_table(True, True),
+}
+
+
+def make_preprocessor(config):
+    """Build a block -> lines function containing only the configured steps."""
+    lowercase = bool(config.get("lowercase"))
+    remove_punctuation = bool(config.get("remove_punctuation"))
+
+    dedup_mode = config.get("dedup_mode", "exact")
+    if dedup_mode not in DEDUP_MODES:
+        raise ValueError(f"unknown dedup_mode {dedup_mode!r}; choose one of {DEDUP_MODES}")
+
+    if lowercase or remove_punctuation:
+        table = ASCII_TABLES[lowercase, remove_punctuation]
+
+        def split_lines(text):
+            if text.isascii():
+                text = text.translate(table)
+            else:
+                if lowercase:
+                    text = text.lower()
+                if remove_punctuation:
+                    text = PUNCT_RE.sub("", text)
+            return text.splitlines()
 
-    if config.get("remove_punctuation"):
-        text = re.sub(r"[^\w\s]", "", text)
+    else:
+        split_lines = str.splitlines
+
+    if not config.get("remove_duplicates"):
+        return split_lines
+
+    seen = set()
+
+    # "hash64" remembers each line's 64-bit SipHash (Python's str hash)
+    # instead of the line itself, with a negligible chance that a collision
+    # drops a line. Each entry costs a fixed ~52 bytes (a 36-byte int plus
+    # its set slot), against ~65 bytes plus the line length for "exact"
+    # (the default), which keeps every distinct line's str alive.
+    if dedup_mode == "hash64":
+
+        def split_unique_lines(text):
+            lines = []
+            for line in dict.fromkeys(split_lines(text)):
+                key = hash(line)
+                if key not in seen:
+                    seen.add(key)
+                    lines.append(line)
+            return lines
+
+        return split_unique_lines
+
+    # Keeping first occurrences in order matches dict.fromkeys() over the
+    # whole text, without holding every line until the end.
+    def split_unique_lines(text):
+        lines = [line for line in dict.fromkeys(split_lines(text)) if line not in seen]
+        seen.update(lines)
+        return lines
+
+    return split_unique_lines
+
+
+def preprocess_blocks(blocks, config):
+    """Yield the processed lines of each block as soon as it is transformed."""
+    # Each block holds whole lines, so the per-character transforms and
+    # splitlines() give the same result as running over the full text.
+    preprocess = make_preprocessor(config)
+
+    for text in blocks:
+        yield preprocess(text)
+
+
+def normalize_newlines(text):
+    # Same translation as text-mode open(): without it, punctuation removal
+    # can join a lone \r and a later \n into one \r\n line break.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_blocks(path, raw_hasher=None):
+    # raw_hasher, if given, is fed the undecoded bytes of every block, so
+    # the raw file hash comes out of the same traversal
+    encoding = locale.getpreferredencoding(False)
+
+    # Small files (including empty ones, which cannot be mapped) are not
+    # worth the mmap setup
+    if os.path.getsize(path) <= BLOCK_SIZE:
+        with open(path, "rb") as f:
+            data = f.read()
+        if raw_hasher is not None:
+            raw_hasher.update(data)
+        yield normalize_newlines(data.decode(encoding))
+        return
 
-    lines = text.splitlines()
+    # Blocks end just after a b"\n", which never splits a \r\n pair or a
+    # multi-byte character, so each block can be normalized on its own.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        size = len(mm)
+
+        while start < size:
+            end = mm.find(b"\n", start + BLOCK_SIZE)
+            end = size if end == -1 else end + 1
+
+            data = mm[start:end]
+            if raw_hasher is not None:
+                raw_hasher.update(data)
+
+            yield normalize_newlines(data.decode(encoding))
+            start = end
+
+
+def process_and_store(raw_file_path, config):
+    """Preprocess, hash, compress and write an object in one streaming pass.
+
+    Returns (raw_hash, object_hash); the raw file is only read once.
+    """
+    check_object_hash_algo()
+    raw_hasher = new_hasher(OBJECT_HASH_ALGO)
+    hasher = new_hasher(OBJECT_HASH_ALGO)
+    compressor = new_compressor()
+    first = True
+
+    # One temp file per process, so parallel writers never share one
+    tmp_path = OBJECTS_DIR / f".tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for lines in preprocess_blocks(read_blocks(raw_file_path, raw_hasher), config):
+                if not lines:
+                    continue
+
+                chunk = "\n".join(lines)
+                if not first:
+                    chunk = "\n" + chunk
+                first = False
+
+                data = chunk.encode()
+                hasher.update(data)
+                f.write(compressor.compress(data))
+
+            f.write(compressor.flush())
+            f.flush()
+            os.fsync(f.fileno())
+            drop_page_cache(f)
+
+        object_hash = hasher.hexdigest()
+        object_path = get_object_path(object_hash)
+
+        # Deduplication happens here
+        if object_path.exists():
+            tmp_path.unlink()
+        else:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, object_path)
+            fsync_dir(object_path.parent)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return raw_hasher.hexdigest(), object_hash
 
-    if config.get("remove_duplicates"):
-        lines = list(dict.fromkeys(lines))
 
-    return "\n".join(lines)
+# ----------------------------
+# Raw Hash Cache
+# ----------------------------
+# "files" maps a raw file path to its hash, trusted while (mtime, size) are
+# unchanged. "versions" maps hash(raw_hash + config) to the object it
+# produced, so re-running an unchanged input skips preprocessing entirely.
+def load_raw_hash_cache():
+    # The cache is written without fsync, so after a crash it may be empty
+    # or truncated; start over rather than failing every create
+    if RAW_HASH_CACHE_FILE.exists():
+        try:
+            return read_json(RAW_HASH_CACHE_FILE)
+        except ValueError:
+            pass
+    return {"files": {}, "versions": {}}
+
+
+def save_raw_hash_cache(cache):
+    # Callers only save after a change. Entries for raw files that no
+    # longer exist can never hit again, so drop them rather than let the
+    # file grow with every dataset ever versioned.
+    cache["files"] = {
+        path: entry for path, entry in cache["files"].items() if os.path.exists(path)
+    }
+
+    # Only a cache: a lost or corrupt file just means rehashing
+    write_json(RAW_HASH_CACHE_FILE, cache, sync=False)
+
+
+def lookup_raw_hash(path, stat, cache):
+    # A hash from another algorithm must miss, or a switch of
+    # DATASET_HASH_ALGO would keep reusing objects addressed the old way
+    entry = cache["files"].get(str(path))
+    if (
+        entry
+        and entry.get("hash_algo") == OBJECT_HASH_ALGO
+        and entry["mtime_ns"] == stat.st_mtime_ns
+        and entry["size"] == stat.st_size
+    ):
+        return entry["raw_hash"]
+    return None
+
+
+def record_raw_hash(path, stat, raw_hash, cache):
+    # stat is taken before the file is read, so a concurrent edit leaves an
+    # entry that no longer matches and is rehashed next time
+    cache["files"][str(path)] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "raw_hash": raw_hash,
+        "hash_algo": OBJECT_HASH_ALGO,
+    }
+
+
+def get_version_key(raw_hash, config):
+    config_string = json.dumps(config, sort_keys=True)
+    prefix = f"{OBJECT_HASH_ALGO}\0{PREPROCESS_VERSION}\0".encode()
+    return hash_content(prefix + bytes.fromhex(raw_hash) + config_string.encode())
+
+
+def get_cached_object(version_key, cache):
+    object_hash = cache["versions"].get(version_key)
+
+    if object_hash is None or not get_object_path(object_hash).exists():
+        return None
+    return object_hash
 
 
 # ----------------------------
@@ -75,7 +503,73 @@ def get_head():
 
 
 def update_head(commit_id):
-    HEAD_FILE.write_text(commit_id)
+    atomic_write(HEAD_FILE, commit_id.encode())
+    fsync_dir(BASE_DIR)
+
+
+# ----------------------------
+# Commit Pack
+# ----------------------------
+# New commits are appended to a single pack.bin with a fixed-size record
+# per commit in pack.idx, so walking history is one mmap rather than an
+# open() per commit. Loose <commit_id>.json files from older repos are
+# still read by load_commit.
+_pack_index = None
+_pack_map = None
+
+
+def get_pack_index():
+    global _pack_index
+
+    if _pack_index is None:
+        _pack_index = {}
+
+        if PACK_INDEX_FILE.exists():
+            data = PACK_INDEX_FILE.read_bytes()
+            # Ignore a trailing partial record left by an interrupted write
+            data = data[: len(data) - len(data) % PACK_RECORD.size]
+
+            for raw_id, offset, length in PACK_RECORD.iter_unpack(data):
+                _pack_index[raw_id.hex()] = (offset, length)
+
+    return _pack_index
+
+
+def read_pack(offset, length) -> bytes:
+    global _pack_map
+
+    # Remap when the pack has grown since it was last mapped
+    if _pack_map is None or offset + length > len(_pack_map):
+        with open(PACK_FILE, "rb") as f:
+            _pack_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return _pack_map[offset : offset + length]
+
+
+def append_to_pack(commit_id, data: bytes):
+    # Concurrent writers must not read the same end-of-pack offset, and
+    # index records must land in the same order as their pack entries
+    with file_lock(PACK_LOCK_FILE):
+        with open(PACK_FILE, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(data)
+
+        with open(PACK_INDEX_FILE, "ab") as f:
+            f.write(PACK_RECORD.pack(bytes.fromhex(commit_id), offset, len(data)))
+
+    get_pack_index()[commit_id] = (offset, len(data))
+
+
+def sync_pack():
+    # Called once before HEAD moves, rather than after every append
+    for path in (PACK_FILE, PACK_INDEX_FILE):
+        if path.exists():
+            fsync_file(path)
+    fsync_dir(COMMITS_DIR)
+
+
+def commit_exists(commit_id):
+    return commit_id in get_pack_index() or (COMMITS_DIR / f"{commit_id}.json").exists()
 
 
 def create_commit(object_hash, config, parent):
@@ -84,45 +578,136 @@ def create_commit(object_hash, config, parent):
         "parent": parent,
         "timestamp": datetime.now().isoformat(),
         "config": config,
+        "hash_algo": OBJECT_HASH_ALGO,
     }
 
-    commit_string = json.dumps(commit_data, sort_keys=True)
-    commit_id = hash_content(commit_string)
-
-    commit_path = COMMITS_DIR / f"{commit_id}.json"
+    # The canonical form is both hashed and stored, so each commit is
+    # serialized once and its pack entry hashes back to its ID
+    commit_bytes = json.dumps(commit_data, sort_keys=True).encode()
+    commit_id = hash_content(commit_bytes)
 
-    if not commit_path.exists():
-        commit_path.write_text(json.dumps(commit_data, indent=4))
+    if not commit_exists(commit_id):
+        append_to_pack(commit_id, commit_bytes)
 
     return commit_id
 
 
+@functools.lru_cache(maxsize=65536)
 def load_commit(commit_id):
-    commit_path = COMMITS_DIR / f"{commit_id}.json"
-    return json.loads(commit_path.read_text())
+    entry = get_pack_index().get(commit_id)
+
+    if entry is not None:
+        return loads_json(read_pack(*entry))
+
+    return read_json(COMMITS_DIR / f"{commit_id}.json")
 
 
 # ----------------------------
 # Create Version (Commit)
 # ----------------------------
 def create_version(raw_file_path, config_file_path):
-    raw_text = Path(raw_file_path).read_text()
-    config = json.loads(Path(config_file_path).read_text())
+    config = read_json(config_file_path)
+
+    check_object_hash_algo()
+    path = Path(raw_file_path).resolve()
+    stat = path.stat()
 
-    processed_text = preprocess_text(raw_text, config)
+    cache = load_raw_hash_cache()
+    cache_changed = False
+    raw_hash = lookup_raw_hash(path, stat, cache)
 
-    object_hash = store_object(processed_text)
+    # A known file whose stat changed may still be identical: one cheap
+    # hashing pass can then save the preprocessing. A new file goes
+    # straight to process_and_store, which hashes it on the way through.
+    if raw_hash is None and str(path) in cache["files"]:
+        raw_hash = hash_file(path, OBJECT_HASH_ALGO)
+        record_raw_hash(path, stat, raw_hash, cache)
+        cache_changed = True
+
+    object_hash = None
+    if raw_hash is not None:
+        object_hash = get_cached_object(get_version_key(raw_hash, config), cache)
+
+    if object_hash is None:
+        raw_hash, object_hash = process_and_store(path, config)
+        record_raw_hash(path, stat, raw_hash, cache)
+        cache["versions"][get_version_key(raw_hash, config)] = object_hash
+        cache_changed = True
+
+    if cache_changed:
+        save_raw_hash_cache(cache)
 
     parent = get_head()
 
     commit_id = create_commit(object_hash, config, parent)
 
+    # Object, then commit, then HEAD, so a crash never leaves HEAD
+    # pointing at something that was not written
+    sync_pack()
     update_head(commit_id)
 
     print("New commit created:")
     print(commit_id)
 
 
+def create_batch(manifest_path):
+    """Create one commit per {"raw": ..., "config": ...} line of a JSONL manifest."""
+    entries = [
+        loads_json(line)
+        for line in Path(manifest_path).read_bytes().splitlines()
+        if line.strip()
+    ]
+    configs = [read_json(entry["config"]) for entry in entries]
+
+    check_object_hash_algo()
+    paths = [Path(entry["raw"]).resolve() for entry in entries]
+    stats = [path.stat() for path in paths]
+
+    # Only stat-level cache hits are resolved here; the parent never reads
+    # raw files, so all hashing happens inside the workers
+    cache = load_raw_hash_cache()
+    object_hashes = []
+
+    for path, stat, config in zip(paths, stats, configs):
+        raw_hash = lookup_raw_hash(path, stat, cache)
+        object_hash = None
+        if raw_hash is not None:
+            object_hash = get_cached_object(get_version_key(raw_hash, config), cache)
+        object_hashes.append(object_hash)
+
+    # Objects are content-addressed and each worker writes through its own
+    # temp file, so they can be produced in parallel. Commits are chained
+    # afterwards in manifest order, since each one needs its parent's ID.
+    pending = [i for i, object_hash in enumerate(object_hashes) if object_hash is None]
+
+    if pending:
+        # The default worker count is the CPU count, capped on Windows
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(process_and_store, paths[i], configs[i]): i
+                for i in pending
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                raw_hash, object_hashes[i] = future.result()
+                record_raw_hash(paths[i], stats[i], raw_hash, cache)
+                cache["versions"][get_version_key(raw_hash, configs[i])] = object_hashes[i]
+
+        save_raw_hash_cache(cache)
+
+    parent = get_head()
+
+    print("New commits created:")
+
+    for object_hash, config in zip(object_hashes, configs):
+        parent = create_commit(object_hash, config, parent)
+        print(parent)
+
+    if parent is not None:
+        sync_pack()
+        update_head(parent)
+
+
 # ----------------------------
 # Log History
 # ----------------------------
@@ -167,6 +752,9 @@ def main():
     create_parser.add_argument("raw_file")
     create_parser.add_argument("config_file")
 
+    batch_parser = subparsers.add_parser("create-batch")
+    batch_parser.add_argument("manifest")
+
     subparsers.add_parser("log")
 
     checkout_parser = subparsers.add_parser("checkout")
@@ -178,6 +766,9 @@ def main():
     if args.command == "create":
         create_version(args.raw_file, args.config_file)
 
+    elif args.command == "create-batch":
+        create_batch(args.manifest)
+
     elif args.command == "log":
         show_log()
 